@@ -0,0 +1,82 @@
+"""
+Cold start benchmark.
+
+Measures, in a fresh interpreter per run:
+    import: time to import `playmcp_viewer.app`
+    build: time to build the server with `mcp()`
+    first_tool_call: time from spawning the interpreter to the first successful tool call
+
+Run from the project root(`logging.yaml` and `.env` are read from the working directory):
+    uv run python benchmarks/startup.py --runs 5
+"""
+
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+
+async def _first_tool_call(server) -> None:
+    from fastmcp import Client
+
+    async with Client(server) as client:
+        await client.call_tool(
+            "find_mcp_servers",
+            {"cond": "TOTAL_TOOL_CALL_COUNT", "top_n": 1},
+        )
+
+
+def _run_once() -> dict[str, float]:
+    import asyncio
+
+    started = time.perf_counter()
+    from playmcp_viewer.app import mcp
+
+    imported = time.perf_counter()
+    server = mcp()
+    built = time.perf_counter()
+    asyncio.run(_first_tool_call(server))
+    return {
+        "import": imported - started,
+        "build": built - imported,
+        # wall clock, compared with the spawn time taken by the parent process.
+        "called_at": time.time(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_run_once()))
+        return
+
+    results: list[dict[str, float]] = []
+    for _ in range(args.runs):
+        spawned_at = time.time()
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        result["first_tool_call"] = result.pop("called_at") - spawned_at
+        results.append(result)
+
+    for key in ("import", "build", "first_tool_call"):
+        samples = [result[key] for result in results]
+        print(
+            f"{key:>16}: median {statistics.median(samples) * 1000:8.1f}ms"
+            f"  min {min(samples) * 1000:8.1f}ms"
+            f"  max {max(samples) * 1000:8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
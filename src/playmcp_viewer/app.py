@@ -1,27 +1,21 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator
 
-from fastmcp import FastMCP
-from fastmcp.tools.tool import Tool
-from fastmcp.server.middleware.timing import TimingMiddleware
-from fastmcp.server.middleware.logging import LoggingMiddleware
-from fastmcp.server.middleware.caching import ResponseCachingMiddleware
-from fastmcp.server.middleware.rate_limiting import RateLimitingMiddleware
-from fastmcp.server.middleware.error_handling import ErrorHandlingMiddleware
+from playmcp_viewer.config import DIContainer, configure_log
 
-from playmcp_viewer.inbound import (
-    find_mcp_servers,
-    group_by_developer,
-    find_mcp_server_by_id,
-)
-from playmcp_viewer.config import DIContainer, Settings, configure_log
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
 
-def mcp() -> FastMCP:
+def mcp() -> "FastMCP":
     """
     Entrypoint.
+    Heavy modules(fastmcp, middlewares, tools) are imported here rather than at module import.
     """
 
-    settings = Settings()
+    settings = DIContainer.settings()
     with open("logging.yaml", "r") as fd:
         configure_log(fd)
 
@@ -30,12 +24,29 @@ def mcp() -> FastMCP:
         f"load {settings.environment}", extra={"environment": settings.environment}
     )
 
-    mcp: FastMCP = DIContainer().mcp()
+    from fastmcp.tools.tool import Tool
+    from fastmcp.server.middleware.timing import TimingMiddleware
+    from fastmcp.server.middleware.logging import LoggingMiddleware
+    from fastmcp.server.middleware.caching import ResponseCachingMiddleware
+    from fastmcp.server.middleware.rate_limiting import RateLimitingMiddleware
+    from fastmcp.server.middleware.error_handling import ErrorHandlingMiddleware
+
+    from playmcp_viewer.inbound import (
+        find_mcp_servers,
+        group_by_developer,
+        find_mcp_server_by_id,
+        find_trending_mcp_servers,
+    )
+
+    # build a fresh server on every call so tools and middlewares are not registered twice.
+    DIContainer.mcp.reset()
+    mcp: FastMCP = DIContainer.mcp(lifespan=lifespan)
 
     # tools
     mcp.add_tool(Tool.from_function(find_mcp_servers))
     mcp.add_tool(Tool.from_function(group_by_developer))
     mcp.add_tool(Tool.from_function(find_mcp_server_by_id))
+    mcp.add_tool(Tool.from_function(find_trending_mcp_servers))
 
     # middlewares.
     mcp.add_middleware(
@@ -64,3 +75,21 @@ def mcp() -> FastMCP:
     )
 
     return mcp
+
+
+@asynccontextmanager
+async def lifespan(server: "FastMCP") -> AsyncIterator[dict]:
+    """
+    Server lifespan.
+    Pre-warms the catalog cache in the background so it does not delay the server bind.
+    """
+    prewarm: asyncio.Task | None = None
+    if DIContainer.settings().prewarm_on_startup:
+        from playmcp_viewer.inbound.tool import prewarm_catalog
+
+        prewarm = asyncio.create_task(prewarm_catalog())
+    try:
+        yield {}
+    finally:
+        if prewarm is not None:
+            prewarm.cancel()
@@ -1,12 +1,14 @@
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 from logging.config import dictConfig
 
-import yaml
-import structlog
-from fastmcp import FastMCP
 from dependency_injector import containers, providers
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from playmcp_viewer.history import CallCountHistory
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
@@ -15,50 +17,101 @@ class Settings(BaseSettings):
     tool_call_limit_per_second: int
     environment: Literal["local", "dev", "prod"]
 
+    # time budget of a whole tool call, propagated to every upstream request.
+    tool_call_timeout_seconds: float = 30.0
+    # upper bound of a single upstream request.
+    upstream_timeout_seconds: float = 10.0
+    # hedged duplicate requests for idempotent upstream GETs.
+    upstream_hedge_enabled: bool = False
+    upstream_hedge_percentile: float = 95.0
+    upstream_hedge_budget_ratio: float = 0.05
+    # catalog crawls are shared by tool calls within this period.
+    catalog_cache_ttl_seconds: float = 60.0
+    # crawl the catalog into the cache in the background while the server binds.
+    prewarm_on_startup: bool = True
+    # tool call count history seen by crawls.
+    history_resolution_seconds: int = 300
+    history_retention_seconds: int = 30 * 86400
+
+
+def _fastmcp(**kwargs) -> "FastMCP":
+    # fastmcp is heavy to import; defer it until the server is built.
+    from fastmcp import FastMCP
+
+    return FastMCP(**kwargs)
+
 
 class DIContainer(containers.DeclarativeContainer):
-    mcp: FastMCP = providers.Singleton(
-        FastMCP,
+    """
+    Application-wide singletons.
+    Use the class-level providers(e.g. `DIContainer.settings()`) so every module shares the same instance.
+    """
+
+    settings: Settings = providers.Singleton(Settings)
+    mcp: "FastMCP" = providers.Singleton(
+        _fastmcp,
         name="playmcp viewer",
         strict_input_validation=True,
     )
+    history: CallCountHistory = providers.Singleton(
+        CallCountHistory,
+        resolution=settings.provided.history_resolution_seconds,
+        retention=settings.provided.history_retention_seconds,
+    )
 
 
-class JSONFormatter(structlog.stdlib.ProcessorFormatter):
-    """
-    JSON formatter for structlog with proper Unicode support for Korean characters.
-    """
+def __getattr__(name: str):
+    # logging.yaml refers to `playmcp_viewer.config.JSONFormatter`; build it on first access
+    # so importing this module does not pull in structlog.
+    if name == "JSONFormatter":
+        globals()["JSONFormatter"] = formatter = _json_formatter()
+        return formatter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    def __init__(self, **kwargs):
-        # Remove any conflicting keys that might be passed from dictConfig
-        kwargs.pop("processor", None)
-        kwargs.pop("foreign_pre_chain", None)
 
-        # Configure the processor with Unicode support
-        processor = structlog.processors.JSONRenderer(
-            ensure_ascii=False,  # Preserve Korean characters
-            indent=4,
-        )
+def _json_formatter() -> type:
+    import structlog
 
-        # Configure foreign_pre_chain for non-structlog loggers
-        foreign_pre_chain = [
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.ExtraAdder(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-        ]
+    class JSONFormatter(structlog.stdlib.ProcessorFormatter):
+        """
+        JSON formatter for structlog with proper Unicode support for Korean characters.
+        """
 
-        super().__init__(
-            processor=processor,
-            foreign_pre_chain=foreign_pre_chain,
-            **kwargs,
-        )
+        def __init__(self, **kwargs):
+            # Remove any conflicting keys that might be passed from dictConfig
+            kwargs.pop("processor", None)
+            kwargs.pop("foreign_pre_chain", None)
+
+            # Configure the processor with Unicode support
+            processor = structlog.processors.JSONRenderer(
+                ensure_ascii=False,  # Preserve Korean characters
+                indent=4,
+            )
+
+            # Configure foreign_pre_chain for non-structlog loggers
+            foreign_pre_chain = [
+                structlog.stdlib.add_log_level,
+                structlog.stdlib.add_logger_name,
+                structlog.stdlib.ExtraAdder(),
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.StackInfoRenderer(),
+                structlog.processors.format_exc_info,
+                structlog.processors.UnicodeDecoder(),
+            ]
+
+            super().__init__(
+                processor=processor,
+                foreign_pre_chain=foreign_pre_chain,
+                **kwargs,
+            )
+
+    return JSONFormatter
 
 
 def configure_log(config):
+    import yaml
+    import structlog
+
     # Configure structlog early so formatters can use it
     structlog.configure(
         processors=[
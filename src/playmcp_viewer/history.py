@@ -0,0 +1,244 @@
+import time
+import heapq
+from array import array
+from typing import Collection, Iterator, NamedTuple
+
+
+class CallCountGrowth(NamedTuple):
+    """Growth of a MCP server's total tool call count over a window.
+
+    Attributes:
+        server_id: MCP server id
+        window_tool_call_count: Tool calls gained within the window
+        daily_growth: Tool calls gained per day within the window
+        growth_ratio: Tool calls gained relative to the count at the window start
+    """
+
+    server_id: str
+    window_tool_call_count: int
+    daily_growth: float
+    growth_ratio: float
+
+
+class _Series:
+    """Append-only tool call counts of one MCP server.
+
+    The first point is stored as is and every following point as the delta from its predecessor.
+    """
+
+    __slots__ = (
+        "first_at",
+        "first_monthly",
+        "first_total",
+        "last_at",
+        "last_monthly",
+        "last_total",
+        "at_deltas",
+        "monthly_deltas",
+        "total_deltas",
+        "compacted_at",
+    )
+
+    def __init__(self, at: int, monthly: int, total: int):
+        self.first_at = self.last_at = self.compacted_at = at
+        self.first_monthly = self.last_monthly = monthly
+        self.first_total = self.last_total = total
+        self.at_deltas = array("q")
+        self.monthly_deltas = array("q")
+        self.total_deltas = array("q")
+
+    def __len__(self) -> int:
+        return len(self.at_deltas) + 1
+
+    def append(self, at: int, monthly: int, total: int, resolution: int) -> None:
+        if at // resolution == self.last_at // resolution:
+            # keep a single point per bucket by moving the last point.
+            if self.at_deltas:
+                self.at_deltas[-1] += at - self.last_at
+                self.monthly_deltas[-1] += monthly - self.last_monthly
+                self.total_deltas[-1] += total - self.last_total
+            else:
+                self.first_at, self.first_monthly, self.first_total = at, monthly, total
+        else:
+            self.at_deltas.append(at - self.last_at)
+            self.monthly_deltas.append(monthly - self.last_monthly)
+            self.total_deltas.append(total - self.last_total)
+        self.last_at, self.last_monthly, self.last_total = at, monthly, total
+
+    def points(self) -> Iterator[tuple[int, int, int]]:
+        at, monthly, total = self.first_at, self.first_monthly, self.first_total
+        yield at, monthly, total
+        for d_at, d_monthly, d_total in zip(
+            self.at_deltas, self.monthly_deltas, self.total_deltas
+        ):
+            at, monthly, total = at + d_at, monthly + d_monthly, total + d_total
+            yield at, monthly, total
+
+    def window_start(self, since: int, max_gap: int) -> tuple[int, int] | None:
+        """Return the point a window starting at `since` is measured from.
+
+        That is the latest point at or before `since` if it is at most `max_gap` seconds older,
+        otherwise the oldest point after `since`.
+        """
+        point_at, total = self.last_at, self.last_total
+        newer: tuple[int, int] | None = None
+        for i in range(len(self.at_deltas) - 1, -1, -1):
+            if point_at <= since:
+                break
+            newer = point_at, total
+            point_at -= self.at_deltas[i]
+            total -= self.total_deltas[i]
+        if point_at <= since and since - point_at > max_gap:
+            return newer
+        return point_at, total
+
+    def compact(
+        self,
+        now: int,
+        retention: int,
+        coarse_after: int,
+        coarse_resolution: int,
+    ) -> bool:
+        """Drop points older than `retention` and downsample points older than `coarse_after`.
+
+        Returns:
+            False if no point is left.
+        """
+        points: list[tuple[int, int, int]] = []
+        for point in self.points():
+            at = point[0]
+            if at < now - retention:
+                continue
+            if (
+                points
+                and at < now - coarse_after
+                and at // coarse_resolution == points[-1][0] // coarse_resolution
+            ):
+                points[-1] = point
+            else:
+                points.append(point)
+        self.compacted_at = now
+        if not points:
+            return False
+
+        self.first_at, self.first_monthly, self.first_total = points[0]
+        self.at_deltas = array("q")
+        self.monthly_deltas = array("q")
+        self.total_deltas = array("q")
+        for prev, cur in zip(points, points[1:]):
+            self.at_deltas.append(cur[0] - prev[0])
+            self.monthly_deltas.append(cur[1] - prev[1])
+            self.total_deltas.append(cur[2] - prev[2])
+        return True
+
+
+class CallCountHistory:
+    """In-memory time series of per-server tool call counts.
+
+    Recent points are kept at `resolution` and points older than `coarse_after` at `coarse_resolution`,
+    so the number of points per server, and therefore the query cost, is bounded by the retention.
+
+    Attributes:
+        resolution: Seconds per point for recent points.
+        coarse_after: Age in seconds after which points are downsampled.
+        coarse_resolution: Seconds per point for downsampled points.
+        retention: Age in seconds after which points are dropped.
+    """
+
+    def __init__(
+        self,
+        resolution: int = 300,
+        coarse_after: int = 86400,
+        coarse_resolution: int = 3600,
+        retention: int = 30 * 86400,
+    ):
+        self.resolution = resolution
+        self.coarse_after = coarse_after
+        self.coarse_resolution = coarse_resolution
+        self.retention = retention
+        self._series: dict[str, _Series] = {}
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def record(
+        self,
+        server_id: str,
+        monthly_tool_call_count: int,
+        total_tool_call_count: int,
+        at: int | None = None,
+    ) -> None:
+        """Append the counts seen at `at`(unix seconds, defaults to now). Out-of-order points are ignored."""
+        at = int(time.time()) if at is None else at
+        series = self._series.get(server_id)
+        if series is None:
+            self._series[server_id] = _Series(
+                at, monthly_tool_call_count, total_tool_call_count
+            )
+            return
+        if at < series.last_at:
+            return
+
+        series.append(
+            at, monthly_tool_call_count, total_tool_call_count, self.resolution
+        )
+        if at - series.compacted_at >= self.coarse_resolution:
+            if not series.compact(
+                at, self.retention, self.coarse_after, self.coarse_resolution
+            ):
+                del self._series[server_id]
+
+    def trending(
+        self,
+        window: int,
+        top_n: int,
+        server_ids: Collection[str] | None = None,
+        now: int | None = None,
+    ) -> list[CallCountGrowth]:
+        """Return the `top_n` servers with the highest daily growth within the last `window` seconds.
+
+        Growth is measured from the point at the window start, or within one coarse bucket before it,
+        or else from the first point inside the window.
+        Servers observed over less than `coarse_resolution` seconds within the window are skipped,
+        so a few seconds between two observations cannot extrapolate into a huge daily growth.
+
+        Args:
+            window: Seconds to measure growth over.
+            top_n: Maximum number of servers to return.
+            server_ids: Only rank these servers. `None` ranks every server.
+            now: Unix seconds the window ends at. Defaults to now.
+        """
+        now = int(time.time()) if now is None else now
+        since = now - window
+        candidates: list[tuple[float, str, int, int]] = []
+        expired: list[str] = []
+        for server_id, series in self._series.items():
+            if series.last_at < now - self.retention:
+                expired.append(server_id)
+            if series.last_at < since:
+                continue
+            if server_ids is not None and server_id not in server_ids:
+                continue
+            start = series.window_start(since, max_gap=self.coarse_resolution)
+            if start is None:
+                continue
+            start_at, start_total = start
+            elapsed = series.last_at - start_at
+            if elapsed < self.coarse_resolution:
+                continue
+            gained = series.last_total - start_total
+            candidates.append((gained * 86400 / elapsed, server_id, gained, start_total))
+        for server_id in expired:
+            del self._series[server_id]
+
+        return [
+            CallCountGrowth(
+                server_id=server_id,
+                window_tool_call_count=gained,
+                daily_growth=daily_growth,
+                growth_ratio=gained / max(start_total, 1),
+            )
+            for daily_growth, server_id, gained, start_total in heapq.nlargest(
+                top_n, candidates
+            )
+        ]
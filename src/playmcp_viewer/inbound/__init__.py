@@ -1,7 +1,13 @@
-from .tool import find_mcp_servers, group_by_developer, find_mcp_server_by_id
+from .tool import (
+    find_mcp_servers,
+    group_by_developer,
+    find_mcp_server_by_id,
+    find_trending_mcp_servers,
+)
 
 __all__ = [
     "find_mcp_servers",
     "group_by_developer",
     "find_mcp_server_by_id",
+    "find_trending_mcp_servers",
 ]
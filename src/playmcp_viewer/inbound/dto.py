@@ -2,15 +2,13 @@ from typing import Self
 
 from pydantic import BaseModel, Field, ConfigDict, HttpUrl
 
-from playmcp_viewer.config import Settings
+from playmcp_viewer.config import DIContainer
 from playmcp_viewer.outbound.dto import (
     PlaymcpDetailResponse,
     PlaymcpFormattedTool,
     PlaymcpFormattedToolParameter,
 )
 
-settings = Settings()
-
 
 class PlayMCPServer(BaseModel):
     """MCP Server registered in Playmcp hub.
@@ -41,7 +39,7 @@ class PlayMCPServer(BaseModel):
     def of(cls, server: PlaymcpDetailResponse) -> Self:
         return cls(
             id=server.id,
-            url=f"{settings.kakao_playmcp_endpoint}/mcp/{server.id}",
+            url=f"{DIContainer.settings().kakao_playmcp_endpoint}/mcp/{server.id}",
             name=server.name,
             description=server.description,
             developer=server.developer_name,
@@ -148,7 +146,7 @@ class PlayMCPServerDetail(BaseModel):
         server.applicable_ai_service_scope
         return cls(
             id=server.id,
-            url=f"{settings.kakao_playmcp_endpoint}/mcp/{server.id}",
+            url=f"{DIContainer.settings().kakao_playmcp_endpoint}/mcp/{server.id}",
             name=server.name,
             description=server.description,
             developer=server.developer_name,
@@ -199,3 +197,25 @@ class DeveloperInfo(BaseModel):
     mcp_servers: list[PlayMCPServerBriefInfo] = Field(
         description="Developer's MCP servers"
     )
+
+
+class TrendingMCPServer(BaseModel):
+    """MCP Server ranked by the growth of its tool call count.
+
+    Attributes:
+        mcp_server: MCP server
+        window_tool_call_count: Tool calls gained within the window
+        daily_growth: Tool calls gained per day within the window
+        growth_ratio: Tool calls gained relative to the total tool call count at the window start
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    mcp_server: PlayMCPServer = Field(description="MCP server")
+    window_tool_call_count: int = Field(
+        description="Tool calls gained within the window"
+    )
+    daily_growth: float = Field(description="Tool calls gained per day")
+    growth_ratio: float = Field(
+        description="Tool calls gained relative to the total tool call count at the window start"
+    )
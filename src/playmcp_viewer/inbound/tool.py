@@ -1,8 +1,10 @@
+import time
+import uuid
 import asyncio
+import logging
 from typing import Literal
 from collections import defaultdict
 
-from fastmcp import FastMCP
 from fastmcp.server.context import Context
 from fastmcp.dependencies import CurrentContext
 from fastmcp.exceptions import ValidationError, NotFoundError
@@ -12,13 +14,22 @@ from playmcp_viewer.inbound.dto import (
     PlayMCPServer,
     PlayMCPServerDetail,
     PlayMCPServerBriefInfo,
+    TrendingMCPServer,
 )
-from playmcp_viewer.config import DIContainer, Settings
+from playmcp_viewer.config import DIContainer
 from playmcp_viewer.outbound.client import get_playmcp_list, get_playmcp_server
 from playmcp_viewer.outbound.dto import PlaymcpDetailResponse, PlaymcpListResponse
 
-settings = Settings()
-mcp: FastMCP = DIContainer().mcp()
+logger = logging.getLogger("playmcp_viewer.inbound")
+
+# sort condition -> (started_at, crawl) of the latest catalog crawl.
+_catalog: dict[str, tuple[float, asyncio.Task[list[PlaymcpDetailResponse]]]] = {}
+
+_WINDOW_SECONDS = {
+    "DAY": 86400,
+    "WEEK": 7 * 86400,
+    "MONTH": 30 * 86400,
+}
 
 
 async def find_mcp_servers(
@@ -52,6 +63,7 @@ async def find_mcp_servers(
     playmcp_contents = await _find_mcp_servers(
         cond,
         ctx,
+        deadline=_deadline(),
     )
 
     if order_by == "asc":
@@ -90,6 +102,7 @@ async def group_by_developer(
     playmcp_contents: list[PlaymcpDetailResponse] = await _find_mcp_servers(
         cond="TOTAL_TOOL_CALL_COUNT",
         ctx=ctx,
+        deadline=_deadline(),
     )
     mcp_servers = [PlayMCPServer.of(content) for content in playmcp_contents]
     developer_infos: dict[str, list[PlayMCPServerBriefInfo]] = defaultdict(list)
@@ -141,23 +154,115 @@ async def find_mcp_server_by_id(
     playmcp = await get_playmcp_server(
         trace_id=ctx.request_id,
         server_id=id,
+        deadline=_deadline(),
     )
     if playmcp:
+        _record_history([playmcp])
         return PlayMCPServerDetail.of(playmcp)
     raise NotFoundError(f"mcp server {id} not found")
 
 
+async def find_trending_mcp_servers(
+    window: Literal["DAY", "WEEK", "MONTH"] = "WEEK",
+    top_n: int = 10,
+    ctx: Context = CurrentContext(),
+) -> list[TrendingMCPServer]:
+    """
+    Find the MCP servers whose total tool call count is growing fastest, based on the counts observed by this viewer.
+
+    Tool Parameters:
+        window: Period to measure growth over. One of "DAY", "WEEK", or "MONTH".
+        top_n: The maximum number of MCP servers to return (up to 50).
+    Returns:
+        A list of TrendingMCPServer objects sorted by daily growth in descending order, each containing:
+            mcp_server: The MCP server.
+            window_tool_call_count: Tool calls gained within the window.
+            daily_growth: Tool calls gained per day within the window.
+            growth_ratio: Tool calls gained relative to the total tool call count at the window start.
+        Servers observed over less than an hour within the window are not included.
+    """
+    if top_n > 50:
+        raise ValidationError(f"top_n({top_n}) > 50")
+
+    playmcp_contents = await _find_mcp_servers(
+        cond="TOTAL_TOOL_CALL_COUNT",
+        ctx=ctx,
+        deadline=_deadline(),
+    )
+    mcp_servers = {
+        content.id: PlayMCPServer.of(content) for content in playmcp_contents
+    }
+    growths = DIContainer.history().trending(
+        window=_WINDOW_SECONDS[window],
+        top_n=top_n,
+        server_ids=mcp_servers.keys(),
+    )
+
+    resp = [
+        TrendingMCPServer(
+            mcp_server=mcp_servers[growth.server_id],
+            window_tool_call_count=growth.window_tool_call_count,
+            daily_growth=growth.daily_growth,
+            growth_ratio=growth.growth_ratio,
+        )
+        for growth in growths
+    ]
+    return resp
+
+
 async def _find_mcp_servers(
     cond: str,
     ctx: Context = CurrentContext(),
+    deadline: float | None = None,
+) -> list[PlaymcpDetailResponse]:
+    crawl = _catalog_crawl(cond)
+    logger.info(
+        "catalog crawl is joined",
+        extra={"trace_id": ctx.request_id, "crawl_id": crawl.get_name()},
+    )
+    # shielded so a caller timing out does not abort a crawl shared with other callers.
+    shielded = asyncio.shield(crawl)
+    if deadline is None:
+        return await shielded
+    return await asyncio.wait_for(shielded, timeout=deadline - time.monotonic())
+
+
+def _catalog_crawl(cond: str) -> asyncio.Task[list[PlaymcpDetailResponse]]:
+    """
+    Return the crawl of the catalog sorted by `cond`.
+    A crawl started within `catalog_cache_ttl_seconds` is reused, including one still in flight.
+    A new crawl runs under its own deadline and trace id(the task name), not those of a caller.
+    """
+    cached = _catalog.get(cond)
+    if cached is not None:
+        started_at, crawl = cached
+        fresh = (
+            time.monotonic() - started_at
+            <= DIContainer.settings().catalog_cache_ttl_seconds
+        )
+        failed = crawl.done() and (crawl.cancelled() or crawl.exception() is not None)
+        if fresh and not failed:
+            return crawl
+
+    crawl_id = f"crawl-{uuid.uuid4()}"
+    crawl = asyncio.create_task(_crawl(cond, crawl_id, _deadline()), name=crawl_id)
+    _catalog[cond] = (time.monotonic(), crawl)
+    return crawl
+
+
+async def _crawl(
+    cond: str,
+    trace_id: str,
+    deadline: float | None = None,
 ) -> list[PlaymcpDetailResponse]:
     page: int = 0
     playmcp_contents: list[PlaymcpDetailResponse] = []
     while True:
         playmcp_resp: PlaymcpListResponse = await get_playmcp_list(
-            trace_id=ctx.request_id,
+            trace_id=trace_id,
             page=page,
             sort_by=cond,
+            deadline=deadline,
         )
 
         playmcp_contents.extend(playmcp_resp.content)
@@ -167,4 +272,33 @@ async def _find_mcp_servers(
         page += 1
 
         await asyncio.sleep(0.1)
+    _record_history(playmcp_contents)
     return playmcp_contents
+
+
+def _record_history(playmcp_contents: list[PlaymcpDetailResponse]) -> None:
+    history = DIContainer.history()
+    for content in playmcp_contents:
+        history.record(
+            server_id=content.id,
+            monthly_tool_call_count=content.monthly_tool_call_count,
+            total_tool_call_count=content.total_tool_call_count,
+        )
+
+
+def _deadline() -> float:
+    """
+    Absolute deadline of the current tool call on the `time.monotonic()` clock.
+    """
+    return time.monotonic() + DIContainer.settings().tool_call_timeout_seconds
+
+
+async def prewarm_catalog() -> None:
+    """
+    Crawl the catalog sorted by tool call count, the order most tools use, into the catalog cache.
+    Runs in the background at startup; a tool call arriving meanwhile joins the same crawl.
+    """
+    try:
+        await _catalog_crawl("TOTAL_TOOL_CALL_COUNT")
+    except Exception as e:
+        logger.warning("catalog prewarm fails", extra={"error": repr(e)})
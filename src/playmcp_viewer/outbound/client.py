@@ -1,19 +1,34 @@
+import asyncio
 import httpx
 import logging
 
-from playmcp_viewer.config import Settings
+from playmcp_viewer.config import DIContainer
 from playmcp_viewer.outbound.dto import PlaymcpDetailResponse, PlaymcpListResponse
-
-settings = Settings()
+from playmcp_viewer.outbound.hedging import (
+    DeadlineExceeded,
+    HedgeBudget,
+    LatencyTracker,
+    hedged,
+    remaining,
+)
 
 logger = logging.getLogger("playmcp_viewer.outbound")
 
+_latency_trackers: dict[str, LatencyTracker] = {
+    "list": LatencyTracker(),
+    "detail": LatencyTracker(),
+}
+# created on first use so importing this module does not load settings.
+_hedge_budgets: dict[str, HedgeBudget] = {}
+
 
 async def get_playmcp_list(
     trace_id: str,
     sort_by: str,
     page: int = 0,
+    deadline: float | None = None,
 ) -> PlaymcpListResponse:
+    settings = DIContainer.settings()
     params = {
         "page": page,
         "pageSize": 50,
@@ -21,7 +36,14 @@ async def get_playmcp_list(
     }
     path = "/api/v1/mcps"
     async with httpx.AsyncClient(base_url=settings.kakao_playmcp_endpoint) as client:
-        client_resp = await client.get(url=path, params=params)
+        client_resp = await _get(
+            client,
+            trace_id=trace_id,
+            kind="list",
+            path=path,
+            params=params,
+            deadline=deadline,
+        )
         if client_resp.is_success:
             logger.info(
                 "request successes",
@@ -59,10 +81,18 @@ async def get_playmcp_list(
 async def get_playmcp_server(
     trace_id: str,
     server_id: str,
+    deadline: float | None = None,
 ) -> PlaymcpDetailResponse:
+    settings = DIContainer.settings()
     path = f"/api/v1/mcps/{server_id}"
     async with httpx.AsyncClient(base_url=settings.kakao_playmcp_endpoint) as client:
-        client_resp = await client.get(url=path)
+        client_resp = await _get(
+            client,
+            trace_id=trace_id,
+            kind="detail",
+            path=path,
+            deadline=deadline,
+        )
         if client_resp.is_success:
             logger.info(
                 "request successes",
@@ -95,3 +125,64 @@ async def get_playmcp_server(
         },
     )
     return resp
+
+
+async def _get(
+    client: httpx.AsyncClient,
+    trace_id: str,
+    kind: str,
+    path: str,
+    params: dict | None = None,
+    deadline: float | None = None,
+) -> httpx.Response:
+    """
+    Send an idempotent GET bounded by `deadline`, hedged when enabled.
+    """
+    settings = DIContainer.settings()
+    try:
+        timeout = remaining(deadline, settings.upstream_timeout_seconds)
+    except DeadlineExceeded:
+        logger.warning(
+            "request is skipped: deadline exceeded",
+            extra={
+                "trace_id": trace_id,
+                "base_url": settings.kakao_playmcp_endpoint,
+                "path": path,
+                "params": params,
+            },
+        )
+        raise
+
+    async def attempt() -> httpx.Response:
+        return await client.get(url=path, params=params, timeout=timeout)
+
+    try:
+        async with asyncio.timeout(timeout):
+            if not settings.upstream_hedge_enabled:
+                return await attempt()
+            return await hedged(
+                attempt,
+                tracker=_latency_trackers[kind],
+                budget=_hedge_budget(kind, settings.upstream_hedge_budget_ratio),
+                percentile=settings.upstream_hedge_percentile,
+                # a fast 5xx must not cancel a sibling that may still succeed.
+                is_success=lambda resp: not resp.is_server_error,
+            )
+    except (TimeoutError, httpx.TimeoutException) as e:
+        logger.warning(
+            "request times out",
+            extra={
+                "trace_id": trace_id,
+                "base_url": settings.kakao_playmcp_endpoint,
+                "path": path,
+                "params": params,
+                "timeout": timeout,
+            },
+        )
+        raise DeadlineExceeded(f"request to {path} timed out") from e
+
+
+def _hedge_budget(kind: str, ratio: float) -> HedgeBudget:
+    if kind not in _hedge_budgets:
+        _hedge_budgets[kind] = HedgeBudget(ratio=ratio)
+    return _hedge_budgets[kind]
@@ -0,0 +1,144 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when an outbound call has no time budget left."""
+
+
+def remaining(deadline: float | None, default: float) -> float:
+    """Return the seconds left until `deadline`, capped by `default`.
+
+    Args:
+        deadline: Absolute deadline on the `time.monotonic()` clock. `None` means no deadline.
+        default: Upper bound of the returned budget.
+    Raises:
+        DeadlineExceeded: The deadline has already passed.
+    """
+    if deadline is None:
+        return default
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceeded("deadline exceeded")
+    return min(left, default)
+
+
+class LatencyTracker:
+    """Sliding window of the most recent request latencies.
+
+    Attributes:
+        window: Maximum number of samples kept.
+        min_samples: Samples required before a percentile is reported.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, latency: float) -> None:
+        self._samples.append(latency)
+
+    def percentile(self, q: float) -> float | None:
+        """Return the `q`-th percentile (0-100) latency, or `None` if too few samples."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        idx = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+        return ordered[idx]
+
+
+class HedgeBudget:
+    """Limits hedged requests to a fraction of all requests.
+
+    Both counters are halved once `window` requests are counted, so the ratio follows recent traffic.
+
+    Attributes:
+        ratio: Maximum hedged requests per primary request.
+        window: Number of requests after which the counters decay.
+    """
+
+    def __init__(self, ratio: float, window: int = 1000):
+        self.ratio = ratio
+        self.window = window
+        self._requests = 0
+        self._hedges = 0
+
+    def record_request(self) -> None:
+        self._requests += 1
+        if self._requests >= self.window:
+            self._requests //= 2
+            self._hedges //= 2
+
+    def try_acquire(self) -> bool:
+        """Count a hedged request if the budget allows it."""
+        if self._hedges + 1 > self.ratio * self._requests:
+            return False
+        self._hedges += 1
+        return True
+
+
+async def hedged(
+    attempt: Callable[[], Awaitable[T]],
+    tracker: LatencyTracker,
+    budget: HedgeBudget,
+    percentile: float,
+    is_success: Callable[[T], bool] = lambda _: True,
+) -> T:
+    """Run `attempt`, duplicating it once if it is slower than the tracked percentile.
+
+    The first attempt to complete successfully wins and the other one is cancelled.
+    Only the latency of a completed primary attempt is recorded in `tracker`.
+    If no attempt succeeds, the last unsuccessful result is returned, or the last error is raised.
+    Only use this for idempotent requests.
+
+    Args:
+        attempt: Factory producing a fresh request coroutine on each call.
+        tracker: Latency history of this kind of request.
+        budget: Hedging budget shared by this kind of request.
+        percentile: Latency percentile (0-100) after which a hedge is sent.
+        is_success: Whether a result may win.
+    """
+
+    async def primary() -> T:
+        # only completed primaries are recorded: a hedge is faster by selection, a cancelled
+        # primary's time is only a lower bound and a failure may return early.
+        started = time.monotonic()
+        result = await attempt()
+        tracker.record(time.monotonic() - started)
+        return result
+
+    budget.record_request()
+    delay = tracker.percentile(percentile)
+    tasks: set[asyncio.Task[T]] = {asyncio.create_task(primary())}
+    try:
+        if delay is not None:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and budget.try_acquire():
+                tasks.add(asyncio.create_task(attempt()))
+
+        fallback: list[T] = []
+        error: BaseException | None = None
+        pending = tasks
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is not None:
+                    error = task.exception()
+                elif is_success(task.result()):
+                    return task.result()
+                else:
+                    fallback.append(task.result())
+        if fallback:
+            return fallback[-1]
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,40 @@
+import functools
+
+import httpx
+import pytest
+from dependency_injector import providers
+
+from playmcp_viewer.config import DIContainer, Settings
+
+
+@pytest.fixture
+def settings() -> Settings:
+    return Settings(
+        kakao_playmcp_endpoint="https://playmcp.test",
+        tool_call_limit_per_second=1,
+        environment="local",
+        prewarm_on_startup=False,
+    )
+
+
+@pytest.fixture
+def mock_transport(mocker, settings: Settings):
+    """Route every upstream request of the client to the given handler."""
+
+    def route(handler) -> list[httpx.Request]:
+        requests: list[httpx.Request] = []
+
+        async def record(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return await handler(request)
+
+        mocker.patch(
+            "playmcp_viewer.outbound.client.httpx.AsyncClient",
+            functools.partial(
+                httpx.AsyncClient, transport=httpx.MockTransport(record)
+            ),
+        )
+        return requests
+
+    with DIContainer.settings.override(providers.Object(settings)):
+        yield route
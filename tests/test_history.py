@@ -0,0 +1,96 @@
+from playmcp_viewer.history import CallCountHistory
+
+DAY = 86400
+
+
+def test_record_keeps_one_point_per_bucket():
+    # given
+    history = CallCountHistory(resolution=300)
+
+    # when
+    history.record("a", monthly_tool_call_count=1, total_tool_call_count=10, at=0)
+    history.record("a", monthly_tool_call_count=2, total_tool_call_count=20, at=100)
+    history.record("a", monthly_tool_call_count=3, total_tool_call_count=30, at=3700)
+
+    # then
+    (growth,) = history.trending(window=DAY, top_n=1, now=3700)
+    assert growth.window_tool_call_count == 10
+    assert growth.daily_growth == 10 * DAY / 3600
+
+
+def test_record_downsamples_and_drops_old_points():
+    # given
+    history = CallCountHistory(
+        resolution=300,
+        coarse_after=DAY,
+        coarse_resolution=3600,
+        retention=7 * DAY,
+    )
+
+    # when
+    for at in range(0, 10 * DAY, 300):
+        history.record("a", monthly_tool_call_count=0, total_tool_call_count=at, at=at)
+
+    # then
+    (growth,) = history.trending(window=10 * DAY, top_n=1, now=10 * DAY - 300)
+    assert growth.window_tool_call_count <= 7 * DAY + 3600
+    assert growth.daily_growth == DAY
+
+
+def test_trending():
+    # given
+    history = CallCountHistory()
+    for day in range(8):
+        history.record("slow", 0, 100 + day * 10, at=day * DAY)
+        history.record("fast", 0, 100 + day * 100, at=day * DAY)
+        history.record("gone", 0, 100 + day * 1000, at=day * DAY)
+    history.record("new", 0, 100, at=7 * DAY)
+
+    # when
+    growths = history.trending(
+        window=DAY,
+        top_n=2,
+        server_ids={"slow", "fast", "new"},
+        now=7 * DAY,
+    )
+
+    # then
+    assert [growth.server_id for growth in growths] == ["fast", "slow"]
+    assert growths[0].window_tool_call_count == 100
+    assert growths[0].daily_growth == 100
+    assert growths[0].growth_ratio == 100 / 700
+
+
+def test_trending_ignores_points_far_before_window():
+    # given
+    history = CallCountHistory()
+    history.record("sparse", 0, 100, at=0)
+    history.record("sparse", 0, 2900, at=29 * DAY)
+    history.record("steady", 0, 100, at=20 * DAY)
+    history.record("steady", 0, 200, at=25 * DAY)
+    history.record("steady", 0, 300, at=29 * DAY)
+
+    # when
+    growths = history.trending(window=7 * DAY, top_n=10, now=29 * DAY)
+
+    # then
+    assert [growth.server_id for growth in growths] == ["steady"]
+    assert growths[0].window_tool_call_count == 100
+    assert growths[0].daily_growth == 25
+
+
+def test_trending_skips_short_observed_span():
+    # given
+    history = CallCountHistory()
+    base = 10 * DAY
+    history.record("blip", 0, 100, at=base - 301)
+    history.record("blip", 0, 101, at=base - 299)
+    for hour in range(7 * 24 + 1):
+        history.record("steady", 0, 1000 * hour // 24, at=base - 7 * DAY + hour * 3600)
+
+    # when
+    growths = history.trending(window=7 * DAY, top_n=10, now=base)
+
+    # then
+    assert [growth.server_id for growth in growths] == ["steady"]
+    assert growths[0].daily_growth == 1000
@@ -0,0 +1,241 @@
+import time
+import uuid
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastmcp.exceptions import ValidationError
+
+from playmcp_viewer.config import DIContainer, Settings
+from playmcp_viewer.inbound import tool
+
+
+def playmcp_server(id: str, total_tool_call_count: int = 0) -> dict:
+    return {
+        "id": id,
+        "name": f"{id} name",
+        "description": f"{id} description",
+        "status": "ACTIVE",
+        "starterMessages": [],
+        "formattedTools": [],
+        "monthlyToolCallCount": 0,
+        "totalToolCallCount": total_tool_call_count,
+        "identifyName": id,
+        "applicableAIServiceScope": "ALL",
+        "featuredLevel": 0,
+        "image": {
+            "path": f"/{id}.png",
+            "fullUrl": f"https://cdn.playmcp.test/{id}.png",
+            "cdnUrl": f"https://cdn.playmcp.test/{id}.png",
+        },
+        "developerName": "developer",
+        "authConfigSummary": {},
+    }
+
+
+def playmcp_list(*servers: dict) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "page": 0,
+            "totalPages": 1,
+            "totalElements": len(servers),
+            "content": list(servers),
+        },
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    tool._catalog.clear()
+    DIContainer.history.reset()
+    yield
+    tool._catalog.clear()
+    DIContainer.history.reset()
+
+
+def context() -> SimpleNamespace:
+    return SimpleNamespace(request_id=str(uuid.uuid4()))
+
+
+@pytest.mark.asyncio
+async def test_catalog_crawl_is_shared_while_in_flight(mock_transport):
+    # given
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return playmcp_list(playmcp_server("a"))
+
+    requests = mock_transport(handler)
+
+    # when
+    resps = await asyncio.gather(
+        tool._find_mcp_servers("TOTAL_TOOL_CALL_COUNT", context()),
+        tool._find_mcp_servers("TOTAL_TOOL_CALL_COUNT", context()),
+    )
+
+    # then
+    assert [[content.id for content in resp] for resp in resps] == [["a"], ["a"]]
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ttl, expected_requests", [(60.0, 1), (0.0, 2)])
+async def test_catalog_crawl_is_reused_within_ttl(
+    mock_transport, settings: Settings, ttl: float, expected_requests: int
+):
+    # given
+    settings.catalog_cache_ttl_seconds = ttl
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return playmcp_list(playmcp_server("a"))
+
+    requests = mock_transport(handler)
+
+    # when
+    await tool._find_mcp_servers("TOTAL_TOOL_CALL_COUNT", context())
+    await asyncio.sleep(0.01)
+    await tool._find_mcp_servers("TOTAL_TOOL_CALL_COUNT", context())
+
+    # then
+    assert len(requests) == expected_requests
+
+
+@pytest.mark.asyncio
+async def test_catalog_crawl_restarts_after_failure(mock_transport):
+    # given
+    responses = iter([httpx.Response(500), playmcp_list(playmcp_server("a"))])
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return next(responses)
+
+    requests = mock_transport(handler)
+
+    # when
+    with pytest.raises(RuntimeError):
+        await tool._find_mcp_servers("TOTAL_TOOL_CALL_COUNT", context())
+    resp = await tool._find_mcp_servers("TOTAL_TOOL_CALL_COUNT", context())
+
+    # then
+    assert [content.id for content in resp] == ["a"]
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_catalog_crawl_restarts_after_cancel(mock_transport):
+    # given
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return playmcp_list(playmcp_server("a"))
+
+    requests = mock_transport(handler)
+    prewarm = asyncio.create_task(tool.prewarm_catalog())
+    await asyncio.sleep(0.01)
+    prewarm.cancel()
+    await asyncio.sleep(0.01)
+
+    # when
+    resp = await tool._find_mcp_servers("TOTAL_TOOL_CALL_COUNT", context())
+
+    # then
+    assert [content.id for content in resp] == ["a"]
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_caller_timeout_does_not_cancel_shared_crawl(mock_transport):
+    # given
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.2)
+        return playmcp_list(playmcp_server("a"))
+
+    requests = mock_transport(handler)
+
+    # when
+    hurried = tool._find_mcp_servers(
+        "TOTAL_TOOL_CALL_COUNT", context(), deadline=time.monotonic() + 0.05
+    )
+    patient = tool._find_mcp_servers(
+        "TOTAL_TOOL_CALL_COUNT", context(), deadline=time.monotonic() + 10
+    )
+    hurried_resp, patient_resp = await asyncio.gather(
+        hurried, patient, return_exceptions=True
+    )
+
+    # then
+    assert isinstance(hurried_resp, TimeoutError)
+    assert [content.id for content in patient_resp] == ["a"]
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_mcp_registers_tools_and_middlewares_once(mock_transport, mocker):
+    # given
+    from playmcp_viewer.app import mcp
+
+    mocker.patch("playmcp_viewer.app.configure_log")
+
+    # when
+    first = mcp()
+    second = mcp()
+
+    # then
+    assert first is not second
+    assert len(second.middleware) == len(first.middleware) == 5
+    assert len(await second.get_tools()) == 4
+
+
+@pytest.mark.asyncio
+async def test_find_trending_mcp_servers(mock_transport):
+    # given
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return playmcp_list(
+            playmcp_server("a", total_tool_call_count=300),
+            playmcp_server("b", total_tool_call_count=150),
+        )
+
+    mock_transport(handler)
+    two_days_ago = int(time.time()) - 2 * 86400
+    history = DIContainer.history()
+    for server_id in ("a", "b", "gone"):
+        history.record(server_id, 0, 100, at=two_days_ago)
+    history.record("gone", 0, 100_000, at=two_days_ago + 86400)
+
+    # when
+    resp = await tool.find_trending_mcp_servers(window="WEEK", top_n=1, ctx=context())
+
+    # then
+    assert [server.mcp_server.id for server in resp] == ["a"]
+    assert resp[0].mcp_server.total_tool_call_count == 300
+    assert resp[0].window_tool_call_count == 200
+    assert resp[0].daily_growth == pytest.approx(100, rel=0.01)
+    assert resp[0].growth_ratio == 2
+
+
+@pytest.mark.asyncio
+async def test_find_trending_mcp_servers_window(mock_transport):
+    # given
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return playmcp_list(playmcp_server("a", total_tool_call_count=300))
+
+    mock_transport(handler)
+    DIContainer.history().record("a", 0, 100, at=int(time.time()) - 2 * 86400)
+
+    # when
+    resp = await tool.find_trending_mcp_servers(window="DAY", top_n=10, ctx=context())
+
+    # then
+    assert resp == []
+
+
+@pytest.mark.asyncio
+async def test_find_trending_mcp_servers_top_n_limit(mock_transport):
+    # given
+    requests = mock_transport(None)
+
+    # when
+    with pytest.raises(ValidationError):
+        await tool.find_trending_mcp_servers(window="WEEK", top_n=51, ctx=context())
+
+    # then
+    assert requests == []
@@ -1,9 +1,12 @@
+import time
 import uuid
 
+import httpx
 import pytest
 
-from playmcp_viewer.outbound.client import get_playmcp_list
+from playmcp_viewer.outbound.client import get_playmcp_list, get_playmcp_server
 from playmcp_viewer.outbound.dto import PlaymcpDetailResponse, PlaymcpListResponse
+from playmcp_viewer.outbound.hedging import DeadlineExceeded
 
 
 @pytest.mark.asyncio
@@ -33,3 +36,43 @@ async def test_get_playmcp_list(sort_by: str):
             page = page + 1
     # then
     assert len(total_contents) == resp.total_elements
+
+
+@pytest.mark.asyncio
+async def test_get_playmcp_server_deadline_exceeded(mock_transport):
+    # given
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    requests = mock_transport(handler)
+
+    # when
+    with pytest.raises(DeadlineExceeded):
+        await get_playmcp_server(
+            trace_id=str(uuid.uuid4()),
+            server_id="server",
+            deadline=time.monotonic() - 1,
+        )
+
+    # then
+    assert requests == []
+
+
+@pytest.mark.asyncio
+async def test_get_playmcp_list_upstream_timeout(mock_transport):
+    # given
+    async def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timeout", request=request)
+
+    requests = mock_transport(handler)
+
+    # when
+    with pytest.raises(DeadlineExceeded):
+        await get_playmcp_list(
+            trace_id=str(uuid.uuid4()),
+            sort_by="CREATED_AT",
+            deadline=time.monotonic() + 10,
+        )
+
+    # then
+    assert len(requests) == 1
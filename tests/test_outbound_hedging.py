@@ -0,0 +1,162 @@
+import time
+import asyncio
+
+import pytest
+
+from playmcp_viewer.outbound.hedging import (
+    DeadlineExceeded,
+    HedgeBudget,
+    LatencyTracker,
+    hedged,
+    remaining,
+)
+
+
+def test_remaining():
+    # given
+    deadline = time.monotonic() + 100
+
+    # when
+    left = remaining(deadline, default=5)
+
+    # then
+    assert left == 5
+    assert remaining(None, default=5) == 5
+    with pytest.raises(DeadlineExceeded):
+        remaining(time.monotonic() - 1, default=5)
+
+
+def test_latency_tracker_percentile():
+    # given
+    tracker = LatencyTracker(window=100, min_samples=10)
+
+    # when
+    for i in range(1, 101):
+        tracker.record(i / 100)
+
+    # then
+    assert tracker.percentile(95) == 0.95
+    assert LatencyTracker(min_samples=10).percentile(95) is None
+
+
+def test_hedge_budget():
+    # given
+    budget = HedgeBudget(ratio=0.1)
+
+    # when
+    acquired = 0
+    for _ in range(100):
+        budget.record_request()
+        acquired += budget.try_acquire()
+
+    # then
+    assert acquired == 10
+
+
+@pytest.mark.asyncio
+async def test_hedged_first_response_wins():
+    # given
+    tracker = LatencyTracker(min_samples=1)
+    tracker.record(0.01)
+    budget = HedgeBudget(ratio=1.0)
+    delays = iter([1.0, 0.0])
+
+    async def attempt() -> float:
+        delay = next(delays)
+        await asyncio.sleep(delay)
+        return delay
+
+    # when
+    result = await hedged(attempt, tracker=tracker, budget=budget, percentile=50)
+
+    # then
+    assert result == 0.0
+
+
+def test_hedge_budget_concurrent_requests():
+    # given
+    budget = HedgeBudget(ratio=1.0)
+    budget.record_request()
+    budget.record_request()
+
+    # when
+    acquired = [budget.try_acquire(), budget.try_acquire(), budget.try_acquire()]
+
+    # then
+    assert acquired == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_hedged_cancels_loser_without_recording_its_latency():
+    # given
+    tracker = LatencyTracker(min_samples=1)
+    tracker.record(0.01)
+    budget = HedgeBudget(ratio=1.0)
+    delays = iter([1.0, 0.0])
+    cancelled = asyncio.Event()
+
+    async def attempt() -> float:
+        delay = next(delays)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return delay
+
+    # when
+    await hedged(attempt, tracker=tracker, budget=budget, percentile=50)
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await asyncio.sleep(0)
+
+    # then
+    assert cancelled.is_set()
+    assert tracker.percentile(100) == 0.01
+
+
+@pytest.mark.asyncio
+async def test_hedged_unsuccessful_result_does_not_win():
+    # given
+    tracker = LatencyTracker(min_samples=1)
+    tracker.record(0.01)
+    budget = HedgeBudget(ratio=1.0)
+    results = iter([(0.1, "ok"), (0.0, "error")])
+
+    async def attempt() -> str:
+        delay, result = next(results)
+        await asyncio.sleep(delay)
+        return result
+
+    # when
+    result = await hedged(
+        attempt,
+        tracker=tracker,
+        budget=budget,
+        percentile=50,
+        is_success=lambda result: result == "ok",
+    )
+
+    # then
+    assert result == "ok"
+
+
+@pytest.mark.asyncio
+async def test_hedged_records_completed_primary_only():
+    # given
+    tracker = LatencyTracker(min_samples=1)
+    budget = HedgeBudget(ratio=1.0)
+
+    async def fails() -> None:
+        raise ConnectionError("refused")
+
+    async def succeeds() -> str:
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    # when
+    with pytest.raises(ConnectionError):
+        await hedged(fails, tracker=tracker, budget=budget, percentile=50)
+    await hedged(succeeds, tracker=tracker, budget=budget, percentile=50)
+
+    # then
+    assert tracker.percentile(0) >= 0.05